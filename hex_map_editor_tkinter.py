@@ -7,16 +7,32 @@ Run with:             python3 hex_map_editor_tkinter.py
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from pathlib import Path
+import hashlib
 import json
 import math
+import os
+import queue
 import re
-from PIL import Image, ImageTk
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw, ImageTk
+
+try:
+    import pyvips       # optional: much faster thumbnailing where libvips is installed
+except (ImportError, OSError):
+    pyvips = None
 
 # ─── Colours ──────────────────────────────────────────────────────────────────
 BG            = "#14161e"
 PANEL_BG      = "#1e2130"
 PANEL_BORDER  = "#3c4158"
 GRID_COL      = "#3c4150"
+GRID_FILL     = "#282c3a"
 GRID_HOVER    = "#7882a0"
 GRID_SEL      = "#dcb43c"
 GRID_SEL_OV   = "#ff9932"
@@ -39,24 +55,37 @@ MIN_HEX_SIZE        = 20
 MAX_HEX_SIZE        = 160
 SIDEBAR_W           = 330
 THUMB               = 72
+THUMB_CELL          = (THUMB + 18, THUMB + 30)   # sidebar sheet pitch: thumb, name, margins
+THUMB_COLS          = max(1, (SIDEBAR_W - 32) // (THUMB + 8))
+SHEET_STRIP_ROWS    = 4       # sheet rows per photo; strips are made as they scroll into view
 ROTATIONS           = 6
 OVERLAY_SCALE_DEFAULT = 0.5   # fraction of hex diameter
+OVERLAY_ROT_STEP    = 15      # degrees per [ / ] press; overlays render in these steps
+
+TILE_MIP_LEVELS     = (40, 60, 80, 120, 160, 240, 320)   # covers 2 × MIN..MAX_HEX_SIZE
+PHOTO_CACHE_MAX     = 512
+THUMB_IMG_CACHE_MAX = 4096    # PIL thumbnails held in memory; a whole bundle fits
+THUMB_CACHE_DIR     = Path.home() / ".cache" / "dnd-map" / "thumbs"
+SOURCE_CACHE_MAX    = 128
+MIP_CACHE_MAX       = 384     # hard cap on tiles with mips (~850 KB each)
+
+SQRT3     = math.sqrt(3)
+INV_SQRT3 = 1 / SQRT3
 
 
 # ─── Realm Brew folder detection ──────────────────────────────────────────────
 
+_RE_NUM_PREFIX   = re.compile(r"^\d\s*[•·]\s*")
+_RE_STRIP_PREFIX = re.compile(r"^(?:Realm Brew - |Realm Brew )")
+_RE_STRIP_SUFFIX = re.compile(r"(?: - Digital Tiles| - Digital Overlays"
+                              r"| Digital Tiles| Digital Overlays| Tiles| Overlays)$")
+_RE_TILE_FOLDER  = re.compile(r"tile|dungeon|river|cavern|subterranean|underdark")
+
+
 def _clean_display_name(folder_name: str) -> str:
-    name = re.sub(r"^\d\s*[•·]\s*", "", folder_name)
-    for strip in ["Realm Brew - ", "Realm Brew "]:
-        if name.startswith(strip):
-            name = name[len(strip):]
-            break
-    for suffix in [" - Digital Tiles", " - Digital Overlays",
-                   " Digital Tiles", " Digital Overlays",
-                   " Tiles", " Overlays"]:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)]
-            break
+    name = _RE_NUM_PREFIX.sub("", folder_name)
+    name = _RE_STRIP_PREFIX.sub("", name, count=1)
+    name = _RE_STRIP_SUFFIX.sub("", name, count=1)
     return name.strip()
 
 
@@ -65,37 +94,48 @@ def _is_overlay_folder(name: str) -> bool:
 
 
 def _is_tile_folder(name: str) -> bool:
-    low = name.lower()
-    return any(k in low for k in ("tile", "dungeon", "river", "cavern",
-                                   "subterranean", "underdark"))
+    return _RE_TILE_FOLDER.search(name.lower()) is not None
 
 
 # ─── Hex math (flat-top) ──────────────────────────────────────────────────────
 
-def hex_corners(cx, cy, size):
-    pts = []
-    for i in range(6):
-        a = math.radians(60 * i)
-        pts += [cx + size * math.cos(a), cy + size * math.sin(a)]
-    return pts
+def hex_corner_offsets(size):
+    """(dx, dy) of each corner from the centre of a hex of this size."""
+    return tuple((size * math.cos(k * math.pi / 3), size * math.sin(k * math.pi / 3))
+                 for k in range(6))
 
 
 def hex_to_pixel(col, row, size):
-    return size * 1.5 * col, size * math.sqrt(3) * (row + 0.5 * (col & 1))
+    return size * 1.5 * col, size * SQRT3 * (row + 0.5 * (col & 1))
+
+
+def _cube_round(q, r):
+    """Round fractional axial (q, r) to the nearest hex, keeping q + r + s = 0."""
+    s = -q - r
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+    return rq, rr
 
 
 def pixel_to_hex(px, py, size):
-    col = int(round(px / (size * 1.5)))
-    best, best_d = (col, 0), float("inf")
-    for dc in (-1, 0, 1):
-        for dr in (-2, -1, 0, 1, 2):
-            c = col + dc
-            r = int(round(py / (size * math.sqrt(3)) - 0.5 * (c & 1))) + dr
-            hx, hy = hex_to_pixel(c, r, size)
-            d = (px - hx) ** 2 + (py - hy) ** 2
-            if d < best_d:
-                best_d, best = d, (c, r)
-    return best
+    q, r = _cube_round((2.0 / 3.0) * px / size,
+                       (-px / 3.0 + py * INV_SQRT3) / size)
+    # axial → odd-q offset (odd columns sit half a hex lower)
+    return q, r + (q - (q & 1)) // 2
+
+
+def hex_key(col, row):
+    """Pack (col, row) into one int, the key of HexMap.tiles."""
+    return (col << 32) | (row & 0xFFFFFFFF)
+
+
+def key_hex(key):
+    row = key & 0xFFFFFFFF
+    return key >> 32, row - (1 << 32) if row & 0x80000000 else row
 
 
 # ─── Data classes ─────────────────────────────────────────────────────────────
@@ -104,18 +144,21 @@ class TileInfo:
     def __init__(self, path, category, display_category):
         self.path, self.category, self.display_category = Path(path), category, display_category
         self.name = Path(path).stem.replace("_", " ").replace("-", " ").title()
+        self.display_name = self.name[:13]     # sidebar caption
 
 
 class OverlayInfo:
     def __init__(self, path, category, display_category):
         self.path, self.category, self.display_category = Path(path), category, display_category
         self.name = Path(path).stem.replace("_", " ").replace("-", " ").title()
+        self.display_name = self.name[:13]     # sidebar caption
 
 
 class PlacedTile:
     def __init__(self, col, row, path, category, rotation=0):
         self.col, self.row, self.path = col, row, str(path)
         self.category, self.rotation  = category, rotation
+        self.stem = Path(path).stem     # shown in the view sidebar
 
 
 class PlacedOverlay:
@@ -126,82 +169,480 @@ class PlacedOverlay:
         self.rotation, self.scale      = rotation, scale
 
 
+# .hexmap files (little-endian, columnar):
+#   b"HEXM\0", version u8
+#   strings   count u32, then per string: length u16 + UTF-8 bytes
+#   tiles     n u32, col i32[n], row i32[n], rotation u8[n], path u32[n], category u32[n]
+#   overlays  n u32, col i32[n], row i32[n], offset_x f32[n], offset_y f32[n],
+#             scale f32[n], rotation u16[n], path u32[n]
+# path / category are indices into the string table.  Older maps were JSON
+# and are recognised by not starting with the magic bytes.
+MAP_MAGIC   = b"HEXM\x00"
+MAP_VERSION = 1
+
+
 class HexMap:
     def __init__(self):
         self.tiles, self.overlays, self.filepath = {}, [], None
 
     def save(self, path):
-        data = {
-            "tiles": [{"col": t.col, "row": t.row, "path": t.path,
-                        "category": t.category, "rotation": t.rotation}
-                       for t in self.tiles.values()],
-            "overlays": [{"col": o.col, "row": o.row, "path": o.path,
-                           "offset_x": o.offset_x, "offset_y": o.offset_y,
-                           "rotation": o.rotation, "scale": o.scale}
-                          for o in self.overlays]
-        }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        strings, index = [], {}
+
+        def sid(s):
+            i = index.get(s)
+            if i is None:
+                i = index[s] = len(strings)
+                strings.append(s)
+            return i
+
+        def column(code, values):
+            a = array(code, values)
+            if sys.byteorder == "big":
+                a.byteswap()
+            body.extend(a)
+
+        tiles = self.tiles.values()
+        body  = bytearray(struct.pack("<I", len(tiles)))
+        column("i", (t.col for t in tiles))
+        column("i", (t.row for t in tiles))
+        column("B", (t.rotation % ROTATIONS for t in tiles))
+        column("I", (sid(t.path) for t in tiles))
+        column("I", (sid(t.category) for t in tiles))
+
+        ovs   = self.overlays
+        body += struct.pack("<I", len(ovs))
+        column("i", (o.col for o in ovs))
+        column("i", (o.row for o in ovs))
+        column("f", (o.offset_x for o in ovs))
+        column("f", (o.offset_y for o in ovs))
+        column("f", (o.scale for o in ovs))
+        column("H", (int(round(o.rotation)) % 360 for o in ovs))
+        column("I", (sid(o.path) for o in ovs))
+
+        head = bytearray(MAP_MAGIC)
+        head.append(MAP_VERSION)
+        head += struct.pack("<I", len(strings))
+        for s in strings:
+            b = s.encode("utf-8")
+            head += struct.pack("<H", len(b)) + b
+
+        with open(path, "wb") as f:
+            f.write(head)
+            f.write(body)
         self.filepath = path
 
     def load(self, path):
-        with open(path) as f:
-            data = json.load(f)
-        self.tiles = {(t["col"], t["row"]): PlacedTile(
+        with open(path, "rb") as f:
+            raw = f.read()
+        # Both parsers build new containers; the map only changes once the
+        # whole file has been read.
+        if raw.startswith(MAP_MAGIC):
+            tiles, overlays = self._load_binary(raw)
+        else:
+            tiles, overlays = self._load_json(json.loads(raw))
+        self.tiles, self.overlays = tiles, overlays
+        self.filepath = path
+
+    def _load_binary(self, raw):
+        version = raw[len(MAP_MAGIC)]
+        if version > MAP_VERSION:
+            raise ValueError("This map was saved by a newer version of the editor.")
+        pos = len(MAP_MAGIC) + 1
+
+        def take(fmt, n=1):
+            nonlocal pos
+            fmt = f"<{n}{fmt}"
+            vals = struct.unpack_from(fmt, raw, pos)
+            pos += struct.calcsize(fmt)
+            return vals
+
+        strings = []
+        for _ in range(take("I")[0]):
+            (length,) = take("H")
+            strings.append(raw[pos:pos + length].decode("utf-8"))
+            pos += length
+
+        n = take("I")[0]
+        cols, rows, rots = take("i", n), take("i", n), take("B", n)
+        paths, cats = take("I", n), take("I", n)
+        tiles = {hex_key(c, r): PlacedTile(c, r, strings[p], strings[k], rot)
+                 for c, r, rot, p, k in zip(cols, rows, rots, paths, cats)}
+
+        n = take("I")[0]
+        cols, rows = take("i", n), take("i", n)
+        oxs, oys, scales = take("f", n), take("f", n), take("f", n)
+        rots, paths = take("H", n), take("I", n)
+        overlays = [PlacedOverlay(c, r, strings[p], ox, oy, rot, round(sc, 2))
+                    for c, r, ox, oy, sc, rot, p
+                    in zip(cols, rows, oxs, oys, scales, rots, paths)]
+        return tiles, overlays
+
+    def _load_json(self, data):
+        tiles = {hex_key(t["col"], t["row"]): PlacedTile(
             t["col"], t["row"], t["path"], t.get("category", ""), t.get("rotation", 0))
             for t in data.get("tiles", [])}
-        self.overlays = [PlacedOverlay(
+        overlays = [PlacedOverlay(
             o["col"], o["row"], o["path"],
             o.get("offset_x", 0), o.get("offset_y", 0),
             o.get("rotation", 0), o.get("scale", OVERLAY_SCALE_DEFAULT))
             for o in data.get("overlays", [])]
-        self.filepath = path
+        return tiles, overlays
 
 
 # ─── Image cache ──────────────────────────────────────────────────────────────
 
+class LRUCache(OrderedDict):
+    """Dict that forgets its least recently used entry beyond maxsize."""
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        try:
+            self.move_to_end(key)
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self.trim()
+
+    def trim(self):
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class ImageCache:
     def __init__(self):
-        self._pil, self._photo = {}, {}
+        self._pil   = LRUCache(SOURCE_CACHE_MAX)
+        self._photo = LRUCache(PHOTO_CACHE_MAX)
+        self._mips  = LRUCache(SOURCE_CACHE_MAX)
+        self._mip_lock = threading.Lock()
+        # Background LANCZOS renders: key -> [placeholder photo, callbacks, future]
+        self._pool    = ThreadPoolExecutor(max_workers=2)
+        self._pending = {}
+        self._ready   = queue.SimpleQueue()
+        self._flat    = {}          # size -> plain hex photo, shown while mips load
+        self._aspects = {}          # overlay path -> height / width, from the header
+        self._broken  = set()       # tile paths whose render failed
+        self._thumb_imgs = LRUCache(THUMB_IMG_CACHE_MAX)   # (path, mtime, size) -> PIL thumbnail
+        self._thumb_lock = threading.Lock()
+        self._sheet_imgs = {}       # (paths, size, cols, pitch) -> PIL sheet
+        self._missing_imgs = {}     # size -> placeholder for unreadable thumbs
+        # Sheet strip photos, kept out of the tile photo LRU.
+        self._photo_intern = {}
 
     def _pil_img(self, path):
         s = str(path)
-        if s not in self._pil:
-            self._pil[s] = Image.open(s).convert("RGBA")
-        return self._pil[s]
+        img = self._pil.get(s)
+        if img is None:
+            img = self._pil[s] = Image.open(s).convert("RGBA")
+        return img
+
+    def tile_mips(self, path):
+        """Square downscales of a tile at each TILE_MIP_LEVELS size.
+
+        Zooming resamples from the nearest larger level instead of the
+        full-resolution PNG.  Safe to call from the prefetch thread.
+        """
+        s = str(path)
+        with self._mip_lock:
+            mips = self._mips.get(s)
+        if mips is None:
+            # Built unlocked, so workers build different tiles in parallel;
+            # if two race on the same tile the first one stored wins.
+            raw = Image.open(s)
+            top = TILE_MIP_LEVELS[-1]
+            raw.draft("RGB", (top, top))    # JPEG: decode at reduced size
+            raw = raw.convert("RGBA")
+            mips = {lvl: raw.resize((lvl, lvl), Image.LANCZOS) for lvl in TILE_MIP_LEVELS}
+            with self._mip_lock:
+                mips = self._mips.setdefault(s, mips)
+        return mips
+
+    def has_mips(self, path):
+        with self._mip_lock:
+            return str(path) in self._mips
+
+    def fit_mips(self, n):
+        """Keep the mips of at least *n* tiles (the ones in view), within
+        SOURCE_CACHE_MAX .. MIP_CACHE_MAX."""
+        with self._mip_lock:
+            self._mips.maxsize = max(SOURCE_CACHE_MAX, min(MIP_CACHE_MAX, n))
+            self._mips.trim()
+
+    def prefetch_tile_mips(self, paths, still_wanted):
+        for p in paths:
+            if not still_wanted():
+                return
+            try:
+                self.tile_mips(p)
+            except Exception:
+                pass
 
-    def get_tile_photo(self, path, hex_size, rotation_steps):
+    def get_tile_photo(self, path, hex_size, rotation_steps, fast=False):
+        """fast=True is for transient drawing (the placement ghost): reuse the
+        LANCZOS photo if there is one, otherwise make a cheaper BILINEAR one."""
         size = int(hex_size * 2)
         key  = ("t", str(path), size, rotation_steps)
-        if key not in self._photo:
-            img = self._pil_img(path).copy().resize((size, size), Image.LANCZOS)
-            if rotation_steps:
-                img = img.rotate(-rotation_steps * 60, expand=False)
-            self._photo[key] = ImageTk.PhotoImage(img)
-        return self._photo[key]
+        p = self._photo.get(key)
+        if p is None and fast:
+            key = ("tf", str(path), size, rotation_steps)
+            p = self._photo.get(key)
+        if p is None:
+            img = self._render_tile(self.tile_mips(path), size, rotation_steps,
+                                    Image.BILINEAR if fast else Image.LANCZOS)
+            p = self._photo[key] = ImageTk.PhotoImage(img)
+        return p
+
+    @staticmethod
+    def _render_tile(mips, size, rotation_steps, resample):
+        lvl = next((l for l in TILE_MIP_LEVELS if l >= size), TILE_MIP_LEVELS[-1])
+        img = mips[lvl]
+        if lvl != size:
+            img = img.resize((size, size), resample)
+        if rotation_steps:
+            img = img.rotate(-rotation_steps * 60, expand=False)
+        return img
+
+    def _flat_tile(self, size):
+        """A plain hex the size of a tile, standing in until its mips exist."""
+        p = self._flat.get(size)
+        if p is None:
+            img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+            r   = size / 2
+            ImageDraw.Draw(img).polygon(
+                [(r + dx, r + dy) for dx, dy in hex_corner_offsets(r)], fill=PANEL_BORDER)
+            p = self._flat[size] = ImageTk.PhotoImage(img)
+        return p
+
+    def get_tile_photo_async(self, path, hex_size, rotation_steps, on_ready, tag):
+        """Like get_tile_photo, but never LANCZOS-resizes on the calling thread.
+
+        On a cache miss a NEAREST placeholder is returned and the real photo
+        is rendered on a worker; on_ready(tag) runs from collect_ready() once
+        it is cached.  Tiles whose mip levels are not built yet get a plain
+        hex instead and have their mips built on the worker as well; a tile
+        that can't be rendered keeps the plain hex.
+        """
+        size = int(hex_size * 2)
+        s    = str(path)
+        key  = ("t", s, size, rotation_steps)
+        p = self._photo.get(key)
+        if p is not None:
+            return p
+        if s in self._broken:
+            return self._flat_tile(size)
+        job = self._pending.get(key)
+        if job is None:
+            mips = self._mips.get(s)
+            if mips is None:
+                placeholder = self._flat_tile(size)
+                fut = self._pool.submit(lambda: self._render_tile(
+                    self.tile_mips(s), size, rotation_steps, Image.LANCZOS))
+            else:
+                placeholder = ImageTk.PhotoImage(
+                    self._render_tile(mips, size, rotation_steps, Image.NEAREST))
+                fut = self._pool.submit(self._render_tile, mips, size, rotation_steps,
+                                        Image.LANCZOS)
+            job = self._pending[key] = [placeholder, [], fut]
+            fut.add_done_callback(lambda f, k=key: self._ready.put((k, f)))
+        job[1].append((on_ready, tag))
+        return job[0]
+
+    def has_pending(self):
+        return bool(self._pending)
+
+    def drop_renders_except(self, hex_size):
+        """Cancel background renders for every zoom level but this one."""
+        size = int(hex_size * 2)
+        for key in [k for k in self._pending if k[2] != size]:
+            self._pending.pop(key)[2].cancel()
+
+    def collect_ready(self):
+        """Turn finished background renders into photos.  Tk thread only."""
+        while True:
+            try:
+                key, fut = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            job = self._pending.get(key)
+            if job is None or job[2] is not fut:
+                continue        # dropped by drop_renders_except
+            del self._pending[key]
+            _, callbacks, _ = job
+            try:
+                self._photo[key] = ImageTk.PhotoImage(fut.result())
+            except Exception:
+                self._broken.add(key[1])
+                continue
+            for cb, tag in callbacks:
+                cb(tag)
 
     def get_overlay_photo(self, path, hex_size, scale, rotation_deg):
-        base = max(int(hex_size * 2 * scale), 4)
-        rot  = round(rotation_deg) % 360
-        key  = ("o", str(path), base, rot)
-        if key not in self._photo:
+        """(photo, width, height)."""
+        base   = max(int(hex_size * 2 * scale), 4)
+        bucket = int(round(rotation_deg / OVERLAY_ROT_STEP)) % (360 // OVERLAY_ROT_STEP)
+        key    = ("o", str(path), base, bucket)
+        p = self._photo.get(key)
+        if p is None:
             raw = self._pil_img(path)
             asp = raw.height / max(raw.width, 1)
             img = raw.copy().resize((base, max(int(base * asp), 4)), Image.LANCZOS)
-            if rot:
-                img = img.rotate(-rot, expand=True, resample=Image.BICUBIC)
-            self._photo[key] = ImageTk.PhotoImage(img)
-        return self._photo[key]
-
-    def get_thumb(self, path, size=68):
-        key = ("th", str(path), size)
-        if key not in self._photo:
-            img = self._pil_img(path).copy()
-            img.thumbnail((size, size), Image.LANCZOS)
-            bg  = Image.new("RGBA", (size, size), (40, 40, 55, 255))
-            bg.paste(img, ((size - img.width) // 2, (size - img.height) // 2), img)
-            self._photo[key] = ImageTk.PhotoImage(bg)
-        return self._photo[key]
+            if bucket:
+                img = img.rotate(-bucket * OVERLAY_ROT_STEP, expand=True,
+                                 resample=Image.BILINEAR)
+            p = self._photo[key] = (ImageTk.PhotoImage(img), img.width, img.height)
+        return p
+
+    def overlay_aspect(self, path):
+        """Height / width of the image at *path*, or None if it can't be read.
+        Only the header is read."""
+        s = str(path)
+        if s not in self._aspects:
+            try:
+                with Image.open(s) as img:
+                    self._aspects[s] = img.height / max(img.width, 1)
+            except Exception:
+                self._aspects[s] = None
+        return self._aspects[s]
+
+    def thumb_image(self, path, size=68, mtime=None):
+        """The sidebar thumbnail as a PIL image; safe to call from worker threads.
+        Keyed by modification time too, so an edited file is picked up."""
+        path = str(path)
+        if mtime is None:
+            mtime = os.stat(path).st_mtime_ns
+        key = (path, mtime, size)
+        with self._thumb_lock:
+            bg = self._thumb_imgs.get(key)
+        if bg is None:
+            # Also cached on disk, under THUMB_CACHE_DIR.
+            digest = hashlib.sha1(f"{path}|{mtime}|{size}".encode("utf-8")).hexdigest()
+            cached = THUMB_CACHE_DIR / f"{digest}.png"
+            # Thumbnails are opaque; kept as RGB.
+            try:
+                with Image.open(cached) as img:
+                    bg = img.convert("RGB")
+            except (OSError, ValueError):
+                img = self._shrink(path, size)
+                bg  = Image.new("RGB", (size, size), (40, 40, 55))
+                bg.paste(img, ((size - img.width) // 2, (size - img.height) // 2), img)
+                self._store_thumb(bg, cached)
+            with self._thumb_lock:
+                self._thumb_imgs[key] = bg
+        return bg
+
+    @staticmethod
+    def _shrink(path, size):
+        """The image at *path* scaled to fit size × size, as RGBA."""
+        if pyvips is not None:
+            try:
+                v = pyvips.Image.thumbnail(path, size, height=size).colourspace("srgb")
+                if not v.hasalpha():
+                    v = v.bandjoin(255)
+                return Image.frombytes("RGBA", (v.width, v.height), v.write_to_memory())
+            except pyvips.Error:
+                pass
+        # Palette and grey images are converted first; thumbnail would
+        # otherwise resize them with NEAREST.
+        img = Image.open(path)
+        img.draft("RGB", (size * 2, size * 2))
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        img.thumbnail((size, size), Image.LANCZOS)
+        return img.convert("RGBA")
+
+    @staticmethod
+    def _store_thumb(img, dest):
+        # Written to a temporary file and renamed; failures are ignored.
+        tmp = None
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                img.save(f, "PNG")
+            os.replace(tmp, dest)
+        except OSError:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+    def prefetch_thumbs(self, pool, paths, size, still_wanted):
+        def work(p):
+            if still_wanted():
+                try:
+                    self.thumb_image(p, size)
+                except Exception:
+                    pass
+        for p in paths:
+            pool.submit(work, p)
+
+    def missing_thumb(self, size):
+        """A grey square with a "?" standing in for a file that can't be read;
+        one image per size, shared by every sheet."""
+        img = self._missing_imgs.get(size)
+        if img is None:
+            img = Image.new("RGB", (size, size), "#333333")
+            ImageDraw.Draw(img).text((size // 2, size // 2), "?", fill=TEXT, anchor="mm")
+            self._missing_imgs[size] = img
+        return img
+
+    def thumb_sheet(self, paths, size, cols, pitch):
+        """Every thumbnail of a category pasted onto one image, *cols* to a row
+        on a (w, h) *pitch*, each on a button-coloured box, with missing_thumb
+        in the cells whose file could not be read.  Safe to call from worker
+        threads."""
+        key = (tuple(map(str, paths)), size, cols, pitch)
+        sheet = self._sheet_imgs.get(key)
+        if sheet is None:
+            pw, ph = pitch
+            rows   = max(1, -(-len(paths) // cols))
+            sheet  = Image.new("RGB", (cols * pw, rows * ph), PANEL_BG)
+            box    = Image.new("RGB", (pw - 6, ph - 6), BTN_BG)
+            for i, path in enumerate(paths):
+                x, y = (i % cols) * pw, (i // cols) * ph
+                sheet.paste(box, (x + 3, y + 3))
+                try:
+                    thumb = self.thumb_image(path, size)
+                except Exception:
+                    thumb = self.missing_thumb(size)
+                sheet.paste(thumb, (x + (pw - size) // 2, y + 6))
+            self._sheet_imgs[key] = sheet
+        return sheet
+
+    def prefetch_thumb_sheets(self, pool, groups, size, cols, pitch, still_wanted):
+        def work(paths):
+            if still_wanted():
+                self.thumb_sheet(paths, size, cols, pitch)
+        for paths in groups:
+            pool.submit(work, paths)
+
+    def shutdown(self):
+        """Drop queued renders so exiting doesn't wait for them."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def forget_sidebar_photos(self):
+        """Drop the sheets and interned sidebar photos; a new library (or the
+        same folder reloaded after an edit) brings its own."""
+        self._sheet_imgs.clear()
+        self._photo_intern.clear()
+
+    def get_sheet_strip(self, paths, size, cols, pitch, first_row, n_rows):
+        """Rows first_row .. first_row + n_rows of the thumb_sheet as a photo."""
+        key = ("strip", tuple(map(str, paths)), size, cols, pitch, first_row, n_rows)
+        p = self._photo_intern.get(key)
+        if p is None:
+            sheet = self.thumb_sheet(paths, size, cols, pitch)
+            ph = pitch[1]
+            p = self._photo_intern[key] = ImageTk.PhotoImage(sheet.crop(
+                (0, first_row * ph, sheet.width, min(sheet.height, (first_row + n_rows) * ph))))
+        return p
 
 
 # ─── Library ──────────────────────────────────────────────────────────────────
@@ -209,10 +650,16 @@ class ImageCache:
 class TileLibrary:
     def __init__(self):
         self.categories, self.overlay_categories = {}, {}
+        self.overlay_image_count = 0
         self.cache = ImageCache()
+        self._generation = 0
+        self._thumb_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
 
     def load(self, root):
         self.categories, self.overlay_categories = {}, {}
+        self.overlay_image_count = 0
+        self._generation += 1
+        self.cache.forget_sidebar_photos()
         for d in sorted(Path(root).iterdir()):
             if not d.is_dir():
                 continue
@@ -223,11 +670,34 @@ class TileLibrary:
             if _is_overlay_folder(d.name):
                 self.overlay_categories[display] = [
                     OverlayInfo(p, d.name, display) for p in pngs]
+                self.overlay_image_count += len(pngs)
             else:
                 self.categories[display] = [
                     TileInfo(p, d.name, display) for p in pngs]
+        self._start_prefetch()
         return bool(self.categories) or bool(self.overlay_categories)
 
+    def _start_prefetch(self):
+        gen = self._generation
+        still_wanted = lambda: self._generation == gen
+        # Category by category in tab order, each sheet behind its thumbnails.
+        for cats in (self.categories, self.overlay_categories):
+            for infos in cats.values():
+                paths = [i.path for i in infos]
+                self.cache.prefetch_thumbs(self._thumb_pool, paths, THUMB, still_wanted)
+                self.cache.prefetch_thumb_sheets(self._thumb_pool, [paths], THUMB,
+                                                 THUMB_COLS, THUMB_CELL, still_wanted)
+        # Beyond the cache size the prefetch would only evict its own work.
+        paths = [t.path for tiles in self.categories.values() for t in tiles][:SOURCE_CACHE_MAX]
+        threading.Thread(target=self.cache.prefetch_tile_mips,
+                         args=(paths, still_wanted), daemon=True).start()
+
+    def shutdown(self):
+        """Stop the prefetch and drop queued work, e.g. before exiting."""
+        self._generation += 1
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.cache.shutdown()
+
 
 # ─── Application ──────────────────────────────────────────────────────────────
 
@@ -254,12 +724,37 @@ class App:
         self.sel_overlay_idx  = None
         self.selected_ov_idx  = None
 
-        self._pan_start_mouse = None
-        self._pan_start_cam   = None
+        self._pan_last        = None
+        self._configure_job   = None
         self._drag_ov_idx     = None
         self._drag_ov_offset  = (0, 0)
-        self._photo_refs      = []
-        self._thumb_refs      = []
+        self._sidebar_widgets = dict.fromkeys(("place_tile", "place_overlay", "view"))
+        self._current_sidebar_mode = None
+        self._cache_library_lists()
+        self._corner_cache    = {}
+
+        # Persistent canvas items (see Drawing)
+        self._grid_item       = None    # [image id, photo, (x, y) it is at]
+        self._grid_key        = None    # (hex_size, W, H) the grid image was rendered for
+        self._grid_img        = None
+        self._label_items     = {}      # hex_key -> coordinate text id
+        self._free_labels     = []      # hidden text ids ready for reuse
+        self._hl_items        = None    # [hover outline, selection outline]
+        self._tile_items      = {}      # hex_key -> [image id, photo]
+        self._shown_tiles     = set()
+        # overlay index -> [image id, photo, (x, y), w, h, shown, stale, radius per base px]
+        self._overlay_items   = {}
+        self._sel_rect_box    = None
+        self._ghost_items     = None
+        self._items_view      = None    # (hex_size, cam_x, cam_y) items were laid out for
+        self._extent          = None    # world rect the laid-out cells cover
+        self._restack         = False
+        self._needs_full_redraw = False
+        self._dirty_tiles     = set()
+        self._dirty_overlays  = set()
+        self._render_poll     = None
+        self._redraw_scheduled = False
+        self._rebuild_pending  = False
 
         self._build_ui()
         self._set_mode("view")
@@ -299,8 +794,11 @@ class App:
         main = tk.Frame(self.root, bg=BG)
         main.pack(fill=tk.BOTH, expand=True)
 
-        self.canvas = tk.Canvas(main, bg=BG, highlightthickness=0, cursor="crosshair")
+        self.canvas = tk.Canvas(main, bg=GRID_FILL, highlightthickness=0, cursor="crosshair")
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._sel_rect_id = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline=GRID_SEL_OV, width=2, dash=(6, 3),
+            state=tk.HIDDEN, tags="selrect")
 
         self.sidebar = tk.Frame(main, bg=PANEL_BG, width=SIDEBAR_W)
         self.sidebar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -335,8 +833,8 @@ class App:
         self.root.bind("<Left>",         lambda e: self._rotate_tile(-1))
         self.root.bind("<Delete>",       lambda e: self._delete_action())
         self.root.bind("<BackSpace>",    lambda e: self._delete_action())
-        self.root.bind("<bracketright>", lambda e: self._rotate_overlay(15))
-        self.root.bind("<bracketleft>",  lambda e: self._rotate_overlay(-15))
+        self.root.bind("<bracketright>", lambda e: self._rotate_overlay(OVERLAY_ROT_STEP))
+        self.root.bind("<bracketleft>",  lambda e: self._rotate_overlay(-OVERLAY_ROT_STEP))
         self.root.bind("<equal>",        lambda e: self._scale_overlay(0.1))
         self.root.bind("<minus>",        lambda e: self._scale_overlay(-0.1))
         self.root.bind("<Control-s>",    lambda e: self._save_map())
@@ -344,7 +842,8 @@ class App:
         self.root.bind("<Control-n>",    lambda e: self._new_map())
         self.root.bind("<Control-o>",    lambda e: self._prompt_folder())
         self.root.bind("<Control-e>",    lambda e: self._export_image())
-        self.root.bind("<Configure>",    lambda e: self._redraw())
+        self.root.bind("<Configure>",    self._on_configure)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._redraw()
 
     # ── Mode ──────────────────────────────────────────────────────────────────
@@ -369,11 +868,15 @@ class App:
     def _escape(self):
         if self.selected_ov_idx is not None:
             self.selected_ov_idx = None
-            self._rebuild_sidebar()
+            self._refresh_selection_only()
             self._redraw()
         else:
             self._set_mode("view")
 
+    def _on_close(self):
+        self.library.shutdown()
+        self.root.destroy()
+
     # ── File / folder ─────────────────────────────────────────────────────────
 
     def _prompt_folder(self):
@@ -381,27 +884,35 @@ class App:
         if not folder:
             return
         ok = self.library.load(folder)
+        self._cache_library_lists()
         if ok:
-            cats  = list(self.library.categories.keys())
-            ocats = list(self.library.overlay_categories.keys())
+            cats, ocats = self._cats_cached, self._ocats_cached
             self.sel_category    = cats[0]  if cats  else None
             self.sel_ov_category = ocats[0] if ocats else None
             self.sel_tile_idx = self.sel_overlay_idx = None
-            n_ov = sum(len(v) for v in self.library.overlay_categories.values())
             self.status_var.set(
                 f"Loaded — Tiles: {', '.join(cats)}   "
-                f"Overlays: {', '.join(ocats)}   ({n_ov} overlay images total)")
+                f"Overlays: {', '.join(ocats)}   ({self.library.overlay_image_count} overlay images total)")
         else:
             messagebox.showwarning("Nothing found",
                 "No tiles or overlays found.\n"
                 "Select the top-level 'Realm Brew - Complete Bundle' folder.")
+        self._needs_full_redraw = True
+        self._reset_sidebar()
         self._rebuild_sidebar()
         self._redraw()
 
+    def _cache_library_lists(self):
+        """Category names only change when a folder is loaded; the sidebar
+        reads these instead."""
+        self._cats_cached  = list(self.library.categories)
+        self._ocats_cached = list(self.library.overlay_categories)
+
     def _new_map(self):
         if messagebox.askyesno("New Map", "Start fresh? Unsaved changes will be lost."):
             self.hex_map = HexMap()
             self.selected_hex = self.selected_ov_idx = None
+            self._needs_full_redraw = True
             self.status_var.set("New map created")
             self._redraw()
 
@@ -422,6 +933,7 @@ class App:
         if path:
             try:
                 self.hex_map.load(path)
+                self._needs_full_redraw = True
                 self.status_var.set(f"Loaded: {path}")
                 self._redraw()
             except Exception as e:
@@ -443,7 +955,7 @@ class App:
             hx, hy = hex_to_pixel(ov.col, ov.row, self.hex_size)
             ov.offset_x = event.x - (self.cam_x + hx) - self._drag_ov_offset[0]
             ov.offset_y = event.y - (self.cam_y + hy) - self._drag_ov_offset[1]
-        self._redraw()
+        self._schedule_redraw()
 
     def _on_click(self, event):
         col, row = self._to_hex(event.x, event.y)
@@ -458,7 +970,7 @@ class App:
                 self._drag_ov_offset = (
                     event.x - (self.cam_x + hx) - ov.offset_x,
                     event.y - (self.cam_y + hy) - ov.offset_y)
-                self._rebuild_sidebar()
+                self._refresh_selection_only()
                 self._redraw()
                 return
             if self.sel_overlay_idx is not None and self.sel_ov_category:
@@ -469,7 +981,7 @@ class App:
                     self.selected_ov_idx = len(self.hex_map.overlays) - 1
                     self.status_var.set(
                         f"Placed '{info.name}'  •  Drag to move  •  [ ] rotate  •  –/+ scale  •  Del to remove")
-                    self._rebuild_sidebar()
+                    self._refresh_selection_only()
             self._redraw()
             return
 
@@ -478,38 +990,84 @@ class App:
             tiles = self.library.categories.get(self.sel_category, [])
             if self.sel_tile_idx < len(tiles):
                 t = tiles[self.sel_tile_idx]
-                self.hex_map.tiles[(col, row)] = PlacedTile(
+                self.hex_map.tiles[hex_key(col, row)] = PlacedTile(
                     col, row, str(t.path), self.sel_category, self.placement_rot)
+                self._dirty_tiles.add(hex_key(col, row))
                 self.status_var.set(f"Placed '{t.name}' at ({col},{row})  •  R / ← → to rotate")
-        self._rebuild_sidebar()
+        self._refresh_selection_only()
         self._redraw()
 
     def _on_release(self, event):
         self._drag_ov_idx = None
 
     def _overlay_hit(self, ex, ey):
-        for i in range(len(self.hex_map.overlays) - 1, -1, -1):
-            ov = self.hex_map.overlays[i]
-            hx, hy = hex_to_pixel(ov.col, ov.row, self.hex_size)
-            cx = self.cam_x + hx + ov.offset_x
-            cy = self.cam_y + hy + ov.offset_y
-            hw = int(self.hex_size * ov.scale * 1.2)
-            if abs(ex - cx) <= hw and abs(ey - cy) <= hw:
+        # Topmost first; work in map space so the camera is applied once.
+        size   = self.hex_size
+        step_x, step_y = size * 1.5, size * SQRT3
+        wx, wy = ex - self.cam_x, ey - self.cam_y
+        overlays = self.hex_map.overlays
+        for i in range(len(overlays) - 1, -1, -1):
+            ov = overlays[i]
+            hw = int(size * ov.scale * 1.2)
+            if (abs(wx - step_x * ov.col - ov.offset_x) <= hw and
+                    abs(wy - step_y * (ov.row + 0.5 * (ov.col & 1)) - ov.offset_y) <= hw):
                 return i
         return None
 
     def _pan_start(self, event):
-        self._pan_start_mouse = (event.x, event.y)
-        self._pan_start_cam   = (self.cam_x, self.cam_y)
+        self._pan_last = (event.x, event.y)
 
     def _pan_move(self, event):
-        if self._pan_start_mouse:
-            self.cam_x = self._pan_start_cam[0] + event.x - self._pan_start_mouse[0]
-            self.cam_y = self._pan_start_cam[1] + event.y - self._pan_start_mouse[1]
-            self._redraw()
+        if self._pan_last:
+            dx, dy = event.x - self._pan_last[0], event.y - self._pan_last[1]
+            self._pan_last = (event.x, event.y)
+            self._pan_by(dx, dy)
 
     def _pan_end(self, event):
-        self._pan_start_mouse = None
+        self._pan_last = None
+
+    def _pan_by(self, dx, dy):
+        """Shift the existing items instead of redrawing; redraw only once the
+        viewport leaves the area that was laid out last time."""
+        if not (dx or dy):
+            return
+        laid_out = self._items_view == (self.hex_size, self.cam_x, self.cam_y)
+        self.cam_x += dx
+        self.cam_y += dy
+        self.canvas.move("all", dx, dy)
+        if laid_out:
+            self._items_view = (self.hex_size, self.cam_x, self.cam_y)
+        # These record where the items actually are, so they follow the move.
+        for rec in self._overlay_items.values():
+            rec[2] = (rec[2][0] + dx, rec[2][1] + dy)
+        if self._sel_rect_box is not None:
+            x0, y0, x1, y1 = self._sel_rect_box
+            self._sel_rect_box = (x0 + dx, y0 + dy, x1 + dx, y1 + dy)
+        if self._grid_item is not None:
+            gx, gy = self._grid_item[2]
+            self._grid_item[2] = (gx + dx, gy + dy)
+
+        if self._extent is None or self._redraw_scheduled:
+            return
+        x0, y0, x1, y1 = self._extent
+        W, H = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if (-self.cam_x < x0 or -self.cam_y < y0 or
+                -self.cam_x + W > x1 or -self.cam_y + H > y1):
+            self._schedule_redraw()
+
+    def _on_configure(self, event):
+        # Bound on the root, so every child widget's <Configure> lands here
+        # too (the sidebar fires plenty); only the window itself matters.
+        # A resize then fires a burst of events; draw once it settles.
+        if event.widget is not self.root:
+            return
+        if self._configure_job is not None:
+            self.root.after_cancel(self._configure_job)
+        self._configure_job = self.root.after(50, self._configure_redraw)
+
+    def _configure_redraw(self):
+        self._configure_job = None
+        self._schedule_redraw()
 
     def _on_zoom(self, event):
         self._zoom(1 if event.delta > 0 else -1, event)
@@ -517,10 +1075,14 @@ class App:
     def _zoom(self, direction, event):
         old = self.hex_size
         self.hex_size = max(MIN_HEX_SIZE, min(MAX_HEX_SIZE, self.hex_size + direction * 5))
+        if self.hex_size == old:
+            return
         scale = self.hex_size / old
+        self._needs_full_redraw = True
+        self.library.cache.drop_renders_except(self.hex_size)
         self.cam_x = event.x - scale * (event.x - self.cam_x)
         self.cam_y = event.y - scale * (event.y - self.cam_y)
-        self._redraw()
+        self._schedule_redraw()
 
     # ── Actions ───────────────────────────────────────────────────────────────
 
@@ -528,148 +1090,473 @@ class App:
         if self.mode != "place_tile":
             return
         self.placement_rot = (self.placement_rot + delta) % ROTATIONS
-        if self.selected_hex and self.selected_hex in self.hex_map.tiles:
-            self.hex_map.tiles[self.selected_hex].rotation = self.placement_rot
-        self._rebuild_sidebar()
-        self._redraw()
+        key = self.selected_hex and hex_key(*self.selected_hex)
+        if key is not None and key in self.hex_map.tiles:
+            self.hex_map.tiles[key].rotation = self.placement_rot
+            self._dirty_tiles.add(key)
+        self._schedule_rebuild()
+        self._schedule_redraw()
 
     def _delete_action(self):
         if self.mode == "place_overlay" and self.selected_ov_idx is not None:
             self._delete_overlay(self.selected_ov_idx)
-        elif self.selected_hex and self.selected_hex in self.hex_map.tiles:
-            self.hex_map.tiles.pop(self.selected_hex)
+        elif self.selected_hex and hex_key(*self.selected_hex) in self.hex_map.tiles:
+            key = hex_key(*self.selected_hex)
+            self.hex_map.tiles.pop(key)
+            self._dirty_tiles.add(key)
             self.status_var.set("Tile removed")
-            self._rebuild_sidebar()
+            self._refresh_selection_only()
             self._redraw()
 
     def _rotate_overlay(self, delta):
         if self.selected_ov_idx is not None and self.selected_ov_idx < len(self.hex_map.overlays):
             ov = self.hex_map.overlays[self.selected_ov_idx]
             ov.rotation = (ov.rotation + delta) % 360
-            self._rebuild_sidebar()
-            self._redraw()
+            self._dirty_overlays.add(self.selected_ov_idx)
+            self._schedule_rebuild()
+            self._schedule_redraw()
 
     def _scale_overlay(self, delta):
         if self.selected_ov_idx is not None and self.selected_ov_idx < len(self.hex_map.overlays):
             ov = self.hex_map.overlays[self.selected_ov_idx]
             ov.scale = round(max(0.1, min(5.0, ov.scale + delta)), 2)
-            self._rebuild_sidebar()
-            self._redraw()
+            self._dirty_overlays.add(self.selected_ov_idx)
+            self._schedule_rebuild()
+            self._schedule_redraw()
 
     def _delete_overlay(self, idx):
         if 0 <= idx < len(self.hex_map.overlays):
             self.hex_map.overlays.pop(idx)
+            self._dirty_overlays.update(range(idx, len(self.hex_map.overlays)))
             self.selected_ov_idx = None
             self.status_var.set("Overlay removed")
-            self._rebuild_sidebar()
+            self._refresh_selection_only()
             self._redraw()
 
     # ── Drawing ───────────────────────────────────────────────────────────────
+    #
+    # Canvas items persist between frames.  Each redraw moves / restyles the
+    # items it already has and only creates what has newly scrolled into view;
+    # labels that leave the viewport are hidden and recycled for the next ones.
+    # The grid itself is one pre-rendered image; empty hexes show the canvas
+    # background (GRID_FILL) and placed tiles sit between the two.
+
+    def _schedule_redraw(self):
+        """Redraw once the event queue drains."""
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_scheduled = False
+        self._redraw()
 
     def _redraw(self):
         c = self.canvas
-        c.delete("all")
         W, H = c.winfo_width(), c.winfo_height()
         if W < 2 or H < 2:
             return
-        self._photo_refs = []
-
-        pad = 2
-        tl = pixel_to_hex(-self.cam_x - self.hex_size, -self.cam_y - self.hex_size, self.hex_size)
-        br = pixel_to_hex(-self.cam_x + W + self.hex_size, -self.cam_y + H + self.hex_size, self.hex_size)
-        cols = range(tl[0] - pad, br[0] + pad + 1)
-        rows = range(tl[1] - pad, br[1] + pad + 1)
 
+        # Columns are 1.5 × size apart and rows √3 × size apart (odd columns
+        # half a row lower), so the cell range follows directly from the
+        # world-space window; pad over-scans to cover partly visible hexes.
+        pad    = 2
+        size   = self.hex_size
+        step_x, step_y = 1.5 * size, SQRT3 * size
+        x0, y0 = -self.cam_x - size, -self.cam_y - size
+        x1, y1 = -self.cam_x + W + size, -self.cam_y + H + size
+        cols = range(math.floor(x0 / step_x) - pad, math.ceil(x1 / step_x) + pad + 1)
+        rows = range(math.floor(y0 / step_y - 0.5) - pad, math.ceil(y1 / step_y) + pad + 1)
+
+        # Screen centre of every cell in view: one x per column, one y per
+        # row (half a row lower for odd columns).
+        even    = [(row & 0xFFFFFFFF, self.cam_y + step_y * row) for row in rows]
+        odd     = [(rk, y + 0.5 * step_y) for rk, y in even]
+        visible = {}
         for col in cols:
-            for row in rows:
-                if (col, row) in self.hex_map.tiles:
-                    self._draw_tile_image(col, row, self.hex_map.tiles[(col, row)])
-
-        for col in cols:
-            for row in rows:
-                self._draw_hex_cell(col, row)
+            sx, base = self.cam_x + step_x * col, col << 32
+            for rk, y in (odd if col & 1 else even):
+                visible[base | rk] = (sx, y)
+
+        view  = (self.hex_size, self.cam_x, self.cam_y)
+        moved = view != self._items_view
+        self._sync_tiles(visible, moved)
+        self._sync_grid(W, H, x0, y0)
+        self._sync_labels(visible, moved)
+        self._sync_highlights(moved)
+        self._draw_tile_ghost()
+        self._sync_overlays(W, H)
+
+        if self._restack:
+            for tag in ("grid", "label", "highlight", "ghost", "overlay", "selrect"):
+                c.tag_raise(tag)
+            self._restack = False
+        self._items_view        = view
+        self._extent            = (x0, y0, x1, y1)   # world area covered by cells
+        self._needs_full_redraw = False
+        self._dirty_tiles.clear()
+        self._dirty_overlays.clear()
+        if self._render_poll is None and self.library.cache.has_pending():
+            self._render_poll = self.root.after(15, self._poll_renders)
+
+    def _poll_renders(self):
+        """Swap in tile photos finished by the background renderer."""
+        self._render_poll = None
+        self.library.cache.collect_ready()
+        if self._dirty_tiles:
+            self._redraw()
+        elif self.library.cache.has_pending():
+            self._render_poll = self.root.after(15, self._poll_renders)
+
+    def _sync_tiles(self, visible, moved):
+        c, tiles = self.canvas, self.hex_map.tiles
+        items, shown = self._tile_items, self._shown_tiles
+        in_view = visible.keys() & tiles.keys()
+        if self._needs_full_redraw:
+            self.library.cache.fit_mips(len({tiles[k].path for k in in_view}))
+
+        # Changed tiles that are off-screen are simply dropped; they get a
+        # fresh item if they ever scroll back into view.
+        refresh = set()
+        for key in (list(items) if self._needs_full_redraw else self._dirty_tiles):
+            if key not in items:
+                continue
+            if key in tiles and key in shown:
+                refresh.add(key)
+            else:
+                c.delete(items.pop(key)[0])
+                shown.discard(key)
+
+        now_shown = set()
+        mark_dirty = self._dirty_tiles.add    # one callback for every tile; the key says which
+        for key in in_view:
+            tile = tiles[key]
+            rec  = items.get(key)
+            if rec is None or key in refresh:
+                try:
+                    p = self.library.cache.get_tile_photo_async(
+                        tile.path, self.hex_size, tile.rotation, mark_dirty, key)
+                except Exception:
+                    continue
+                if rec is None:
+                    items[key] = [c.create_image(*visible[key], image=p, anchor=tk.CENTER,
+                                                 tags="tile"), p]
+                    self._restack = True
+                    now_shown.add(key)
+                    continue
+                if rec[1] is not p:
+                    c.itemconfigure(rec[0], image=p)
+                    rec[1] = p
+            if key not in shown:
+                c.itemconfigure(rec[0], state=tk.NORMAL)
+                c.coords(rec[0], *visible[key])
+            elif moved:
+                c.coords(rec[0], *visible[key])
+            now_shown.add(key)
+
+        for key in shown - now_shown:
+            if key in items:
+                c.itemconfigure(items[key][0], state=tk.HIDDEN)
+        self._shown_tiles = now_shown
+
+    def _corners_for_size(self, size):
+        """Corner offsets of a hex of this size; at most one entry per zoom step."""
+        corners = self._corner_cache.get(size)
+        if corners is None:
+            corners = self._corner_cache[size] = hex_corner_offsets(size)
+        return corners
+
+    def _grid_photo(self, W, H):
+        """Outlines of every hex in a window-sized area, as one image.
+
+        The lattice repeats every two columns and every row, so the image is
+        rendered once per (hex_size, W, H) and just repositioned as the camera
+        moves.  Its top-left corner is a lattice point (an even column).
+        """
+        size = self.hex_size
+        key  = (size, W, H)
+        if self._grid_key != key:
+            period_x, period_y = 3 * size, SQRT3 * size
+            # The window plus the redraw margin on each side, plus one period
+            # of slack for aligning the origin to the lattice.
+            iw = int(W + 2 * size + period_x) + 2
+            ih = int(H + 2 * size + period_y) + 2
+            img  = Image.new("RGBA", (iw, ih), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            corners = self._corners_for_size(size)
+            for col in range(-1, int(iw / (1.5 * size)) + 2):
+                x  = 1.5 * size * col
+                oy = 0.5 * period_y if col & 1 else 0.0
+                for row in range(-1, int(ih / period_y) + 2):
+                    y = period_y * row + oy
+                    draw.polygon([(x + dx, y + dy) for dx, dy in corners], outline=GRID_COL)
+            self._grid_img = ImageTk.PhotoImage(img)
+            self._grid_key = key
+        return self._grid_img
+
+    def _sync_grid(self, W, H, x0, y0):
+        c = self.canvas
+        p = self._grid_photo(W, H)
+        period_x, period_y = 3 * self.hex_size, SQRT3 * self.hex_size
+        sx = self.cam_x + math.floor(x0 / period_x) * period_x
+        sy = self.cam_y + math.floor(y0 / period_y) * period_y
+        if self._grid_item is None:
+            self._grid_item = [c.create_image(sx, sy, image=p, anchor=tk.NW, tags="grid"),
+                               p, (sx, sy)]
+            self._restack = True
+            return
+        if self._grid_item[2] != (sx, sy):
+            c.coords(self._grid_item[0], sx, sy)
+            self._grid_item[2] = (sx, sy)
+        if self._grid_item[1] is not p:
+            c.itemconfigure(self._grid_item[0], image=p)
+            self._grid_item[1] = p
+
+    def _sync_labels(self, visible, moved):
+        """Coordinate labels, shown once hexes are big enough to fit them."""
+        c, items, free = self.canvas, self._label_items, self._free_labels
+        show = self.hex_size >= 50
+        for key in [k for k in items if not show or k not in visible]:
+            t = items.pop(key)
+            c.itemconfigure(t, state=tk.HIDDEN)
+            free.append(t)
+        if not show:
+            return
+        for key, (sx, sy) in visible.items():
+            t = items.get(key)
+            if t is None:
+                if free:
+                    t = free.pop()
+                else:
+                    t = c.create_text(0, 0, fill=GRID_COL, font=("Helvetica", 9), tags="label")
+                    self._restack = True
+                items[key] = t
+                c.itemconfigure(t, text="%d,%d" % key_hex(key), state=tk.NORMAL)
+                c.coords(t, sx, sy)
+            elif moved:
+                c.coords(t, sx, sy)
+
+    def _sync_highlights(self, moved):
+        """Hovered / selected hex outlines, drawn over the cached grid image."""
+        c = self.canvas
+        if self._hl_items is None:
+            # [item id, hex it currently outlines]
+            self._hl_items = [
+                [c.create_polygon(0, 0, 0, 0, 0, 0, fill="", outline=GRID_HOVER, width=2,
+                                  tags="highlight", state=tk.HIDDEN), None],
+                [c.create_polygon(0, 0, 0, 0, 0, 0, fill="", outline=GRID_SEL, width=3,
+                                  tags="highlight", state=tk.HIDDEN), None]]
+            self._restack = True
+        corners = self._corners_for_size(self.hex_size)
+        for rec, hx in zip(self._hl_items, (self.hovered_hex, self.selected_hex)):
+            if hx == rec[1] and not moved:
+                continue
+            if hx is None:
+                c.itemconfigure(rec[0], state=tk.HIDDEN)
+            else:
+                sx, sy = self._hex_screen(*hx)
+                c.coords(rec[0], *[v for dx, dy in corners for v in (sx + dx, sy + dy)])
+                if rec[1] is None:
+                    c.itemconfigure(rec[0], state=tk.NORMAL)
+            rec[1] = hx
 
+    def _draw_tile_ghost(self):
+        c = self.canvas
+        if self._ghost_items is None:
+            self._ghost_items = [
+                c.create_image(0, 0, anchor=tk.CENTER, tags="ghost", state=tk.HIDDEN),
+                c.create_polygon(0, 0, 0, 0, 0, 0, fill="#6480ff", outline="",
+                                 stipple="gray50", tags="ghost", state=tk.HIDDEN),
+                None]
+            self._restack = True
+        img_id, poly_id, _ = self._ghost_items
+
+        p = None
         if self.mode == "place_tile" and self.hovered_hex and self.sel_tile_idx is not None:
-            self._draw_tile_ghost(*self.hovered_hex)
-
-        for i, ov in enumerate(self.hex_map.overlays):
-            self._draw_overlay(ov, selected=(i == self.selected_ov_idx))
-
-    def _draw_tile_image(self, col, row, tile):
-        sx, sy = self._hex_screen(col, row)
-        try:
-            p = self.library.cache.get_tile_photo(tile.path, self.hex_size, tile.rotation)
-            self._photo_refs.append(p)
-            self.canvas.create_image(sx, sy, image=p, anchor=tk.CENTER)
-        except Exception:
-            pass
-
-    def _draw_hex_cell(self, col, row):
-        sx, sy  = self._hex_screen(col, row)
-        pts     = hex_corners(sx, sy, self.hex_size)
-        key     = (col, row)
-        is_hov  = (self.hovered_hex == key)
-        is_sel  = (self.selected_hex == key)
-        has     = key in self.hex_map.tiles
-        outline = GRID_SEL if is_sel else GRID_HOVER if is_hov else GRID_COL
-        width   = 3 if is_sel else 2 if is_hov else 1
-        self.canvas.create_polygon(pts, outline=outline,
-                                   fill="" if has else "#282c3a", width=width)
-        if self.hex_size >= 50:
-            self.canvas.create_text(sx, sy, text=f"{col},{row}",
-                                    fill=GRID_COL, font=("Helvetica", 9))
-
-    def _draw_tile_ghost(self, col, row):
-        tiles = self.library.categories.get(self.sel_category, [])
-        if not tiles or self.sel_tile_idx >= len(tiles):
+            tiles = self.library.categories.get(self.sel_category, [])
+            if tiles and self.sel_tile_idx < len(tiles):
+                cache = self.library.cache
+                path  = str(tiles[self.sel_tile_idx].path)
+                try:
+                    if cache.has_mips(path):
+                        p = cache.get_tile_photo(path, self.hex_size,
+                                                 self.placement_rot, fast=True)
+                    else:
+                        # Not one to build a pyramid for on the Tk thread.
+                        p = cache.get_tile_photo_async(path, self.hex_size, self.placement_rot,
+                                                       self._on_ghost_ready, None)
+                except Exception:
+                    p = None
+        if p is None:
+            c.itemconfigure("ghost", state=tk.HIDDEN)
+            self._ghost_items[2] = None
             return
-        sx, sy = self._hex_screen(col, row)
-        try:
-            p = self.library.cache.get_tile_photo(
-                str(tiles[self.sel_tile_idx].path), self.hex_size, self.placement_rot)
-            self._photo_refs.append(p)
-            self.canvas.create_image(sx, sy, image=p, anchor=tk.CENTER)
-            pts = hex_corners(sx, sy, self.hex_size)
-            self.canvas.create_polygon(pts, fill="#6480ff", outline="", stipple="gray50")
-        except Exception:
-            pass
-
-    def _draw_overlay(self, ov, selected=False):
-        hx, hy = hex_to_pixel(ov.col, ov.row, self.hex_size)
-        cx = int(self.cam_x + hx + ov.offset_x)
-        cy = int(self.cam_y + hy + ov.offset_y)
-        try:
-            p = self.library.cache.get_overlay_photo(
-                ov.path, self.hex_size, ov.scale, ov.rotation)
-            self._photo_refs.append(p)
-            self.canvas.create_image(cx, cy, image=p, anchor=tk.CENTER)
-            if selected:
-                hw, hh = p.width() // 2 + 4, p.height() // 2 + 4
-                self.canvas.create_rectangle(
-                    cx - hw, cy - hh, cx + hw, cy + hh,
-                    outline=GRID_SEL_OV, width=2, dash=(6, 3))
-        except Exception:
-            pass
+
+        sx, sy = self._hex_screen(*self.hovered_hex)
+        c.coords(img_id, sx, sy)
+        c.coords(poly_id, *[v for dx, dy in self._corners_for_size(self.hex_size)
+                            for v in (sx + dx, sy + dy)])
+        if self._ghost_items[2] is not p:
+            c.itemconfigure(img_id, image=p)
+            self._ghost_items[2] = p
+        c.itemconfigure("ghost", state=tk.NORMAL)
+
+    def _on_ghost_ready(self, _tag):
+        self._schedule_redraw()
+
+    def _sync_overlays(self, W, H):
+        c, overlays, items = self.canvas, self.hex_map.overlays, self._overlay_items
+        for idx in [i for i in items if i >= len(overlays)]:
+            c.delete(items.pop(idx)[0])
+        refresh = range(len(overlays)) if self._needs_full_redraw else self._dirty_overlays
+
+        # Overlays wholly outside the area a pan can uncover before the next
+        # redraw (see _pan_by) are hidden, and not re-rendered until they return.
+        m, size = self.hex_size, self.hex_size
+        sel_box = None
+        for i, ov in enumerate(overlays):
+            hx, hy = hex_to_pixel(ov.col, ov.row, size)
+            cx = int(self.cam_x + hx + ov.offset_x)
+            cy = int(self.cam_y + hy + ov.offset_y)
+            rec  = items.get(i)
+            base = max(int(size * 2 * ov.scale), 4)
+            if rec is not None:
+                if i in refresh:
+                    rec[6] = True
+                r = rec[7] * base
+            else:
+                # Not rendered yet: a base × base·aspect image rotated any
+                # way has a half-diagonal of at most half their sum.
+                a = self.library.cache.overlay_aspect(ov.path)
+                r = None if a is None else (base + max(base * a, 4)) / 2 + 1
+            if r is not None:
+                on = -m < cx + r and cx - r < W + m and -m < cy + r and cy - r < H + m
+                if rec is not None and on != rec[5]:
+                    c.itemconfigure(rec[0], state=tk.NORMAL if on else tk.HIDDEN)
+                    rec[5] = on
+                if not on:
+                    continue
+            if rec is None or rec[6]:
+                try:
+                    p, w, h = self.library.cache.get_overlay_photo(
+                        ov.path, size, ov.scale, ov.rotation)
+                except Exception:
+                    if rec is not None:
+                        c.delete(items.pop(i)[0])
+                    continue
+                # Half-diagonal per unit of base size bounds the overlay at
+                # any zoom or rotation.
+                k = math.hypot(w, h) / 2 / base
+                if rec is None:
+                    rec = items[i] = [c.create_image(cx, cy, image=p, anchor=tk.CENTER,
+                                                     tags="overlay"),
+                                      p, (cx, cy), w, h, True, False, k]
+                    self._restack = True
+                else:
+                    if rec[1] is not p:
+                        c.itemconfigure(rec[0], image=p)
+                    rec[1], rec[3], rec[4], rec[6], rec[7] = p, w, h, False, k
+            if rec[2] != (cx, cy):
+                c.coords(rec[0], cx, cy)
+                rec[2] = (cx, cy)
+            if i == self.selected_ov_idx:
+                hw, hh = rec[3] // 2 + 4, rec[4] // 2 + 4
+                sel_box = (cx - hw, cy - hh, cx + hw, cy + hh)
+
+        if sel_box != self._sel_rect_box:
+            if sel_box is None:
+                c.itemconfigure(self._sel_rect_id, state=tk.HIDDEN)
+            else:
+                c.coords(self._sel_rect_id, *sel_box)
+                c.itemconfigure(self._sel_rect_id, state=tk.NORMAL)
+            self._sel_rect_box = sel_box
 
     # ── Sidebar ───────────────────────────────────────────────────────────────
 
+    # Each mode keeps its own panel alive; switching modes packs a different
+    # one and a selection change only restyles the widgets it affects.  The
+    # panels are thrown away when a new folder is loaded.
+
     def _rebuild_sidebar(self):
-        for w in self.sidebar.winfo_children():
-            w.destroy()
-        self._thumb_refs = []
-        {"place_tile":    self._build_tile_sidebar,
-         "place_overlay": self._build_overlay_sidebar
-         }.get(self.mode, self._build_view_sidebar)()
+        mode = self.mode if self.mode in self._sidebar_widgets else "view"
+        if mode != self._current_sidebar_mode:
+            old = self._sidebar_widgets.get(self._current_sidebar_mode)
+            if old is not None:
+                old["frame"].pack_forget()
+            panel = self._sidebar_widgets[mode]
+            if panel is None:
+                panel = self._sidebar_widgets[mode] = {
+                    "frame": tk.Frame(self.sidebar, bg=PANEL_BG)}
+                {"place_tile":    self._build_tile_sidebar,
+                 "place_overlay": self._build_overlay_sidebar,
+                 "view":          self._build_view_sidebar}[mode](panel)
+            panel["frame"].pack(fill=tk.BOTH, expand=True)
+            self._current_sidebar_mode = mode
+        self._refresh_sidebar_selection()
+
+    def _reset_sidebar(self):
+        for panel in self._sidebar_widgets.values():
+            if panel is not None:
+                panel["frame"].destroy()
+        self._sidebar_widgets = dict.fromkeys(self._sidebar_widgets)
+        self._current_sidebar_mode = None
+
+    def _refresh_sidebar_selection(self):
+        """Bring the shown panel fully up to date: category tabs and thumbnail
+        grid, then everything _refresh_selection_only covers."""
+        mode  = self._current_sidebar_mode
+        panel = self._sidebar_widgets[mode]
+        refresh = {"place_tile":    self._refresh_tile_category,
+                   "place_overlay": self._refresh_overlay_category}.get(mode)
+        if refresh is not None:
+            refresh(panel)
+        self._refresh_selection_only()
+
+    def _refresh_selection_only(self):
+        """Update just what depends on the current selection (highlighted
+        thumbnail, rotation / scale text, selection sections); for clicks,
+        rotates and edits that leave mode and category alone."""
+        mode  = self._current_sidebar_mode
+        panel = self._sidebar_widgets[mode]
+        {"place_tile":    self._refresh_tile_selection,
+         "place_overlay": self._refresh_overlay_selection,
+         "view":          self._refresh_view_sidebar}[mode](panel)
+
+    def _schedule_rebuild(self):
+        """_refresh_selection_only once the event queue drains, so held-down
+        rotate / scale keys update the sidebar once per idle cycle."""
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            self.root.after_idle(self._flush_rebuild)
+
+    def _flush_rebuild(self):
+        self._rebuild_pending = False
+        self._refresh_selection_only()
+
+    def _sync_highlight(self, panel, idx):
+        grid = panel.get("grid")
+        if grid is not None and grid["sel"] != idx:
+            self._update_selection_highlight(grid, grid["sel"], idx)
 
     def _lbl(self, parent, text, fg=TEXT_DIM, size=9, bold=False):
-        tk.Label(parent, text=text, bg=PANEL_BG, fg=fg,
-                 font=("Helvetica", size, "bold" if bold else "normal"),
-                 wraplength=SIDEBAR_W - 20, justify=tk.LEFT
-                 ).pack(anchor=tk.W, padx=10, pady=(6, 2))
+        l = tk.Label(parent, text=text, bg=PANEL_BG, fg=fg,
+                     font=("Helvetica", size, "bold" if bold else "normal"),
+                     wraplength=SIDEBAR_W - 20, justify=tk.LEFT)
+        l.pack(anchor=tk.W, padx=10, pady=(6, 2))
+        return l
 
     def _divider(self, parent):
         tk.Frame(parent, bg=PANEL_BORDER, height=1).pack(fill=tk.X, padx=8, pady=4)
 
+    @staticmethod
+    def _show(widget, visible, **pack_kw):
+        """Pack or forget *widget*; a section that is already in the wanted
+        state is left alone."""
+        if visible and not widget.winfo_manager():
+            widget.pack(**pack_kw)
+        elif not visible and widget.winfo_manager():
+            widget.pack_forget()
+
     def _btn(self, parent, text, cmd, style="normal", **pack_kw):
         styles = {
             "normal":  (BTN_BG,     BTN_FG,     BTN_HOVER_BG),
@@ -702,72 +1589,164 @@ class App:
         inner = tk.Frame(tc, bg=PANEL_BG)
         tc.create_window((0, 0), window=inner, anchor=tk.NW)
 
+        tabs = {}
         for cat in cats:
             sel = (cat == selected)
-            tk.Button(inner, text=cat,
-                      bg=BTN_ACTIVE_BG if sel else BTN_BG,
-                      fg=BTN_ACTIVE_FG if sel else BTN_FG,
-                      activebackground=BTN_HOVER_BG,
-                      relief=tk.RAISED, bd=1, padx=6, pady=4,
-                      font=("Helvetica", 10), cursor="hand2",
-                      command=lambda c=cat: on_select(c)
-                      ).pack(side=tk.LEFT, padx=2, pady=2)
+            tabs[cat] = tk.Button(inner, text=cat,
+                                  bg=BTN_ACTIVE_BG if sel else BTN_BG,
+                                  fg=BTN_ACTIVE_FG if sel else BTN_FG,
+                                  activebackground=BTN_HOVER_BG,
+                                  relief=tk.RAISED, bd=1, padx=6, pady=4,
+                                  font=("Helvetica", 10), cursor="hand2",
+                                  command=lambda c=cat: on_select(c))
+            tabs[cat].pack(side=tk.LEFT, padx=2, pady=2)
 
         inner.update_idletasks()
         tc.config(scrollregion=tc.bbox("all"))
         # Also allow horizontal scroll with shift+mousewheel
         tc.bind("<Shift-MouseWheel>",
                 lambda e: tc.xview_scroll(-1 if e.delta > 0 else 1, "units"))
+        return tabs
+
+    @staticmethod
+    def _paint_tabs(tabs, selected):
+        for cat, b in tabs.items():
+            sel = (cat == selected)
+            b.config(bg=BTN_ACTIVE_BG if sel else BTN_BG,
+                     fg=BTN_ACTIVE_FG if sel else BTN_FG)
 
-    def _thumb_grid(self, parent, items, selected_idx, on_click):
+    def _thumb_grid(self, parent, on_click):
+        """A canvas showing a category's thumbnails as a sheet image, in
+        strips made as they scroll into view.  Kept, and refilled by
+        _fill_thumb_grid when the category changes."""
         wrap = tk.Frame(parent, bg=PANEL_BG)
         wrap.pack(fill=tk.BOTH, expand=True, padx=8, pady=4)
         vsb = tk.Scrollbar(wrap, orient=tk.VERTICAL)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
-        tc = tk.Canvas(wrap, bg=PANEL_BG, highlightthickness=0, yscrollcommand=vsb.set)
+
+        def on_view(first, last):
+            # Called by Tk whenever the visible part changes: scroll or resize.
+            vsb.set(first, last)
+            self._show_strips(grid)
+        tc = tk.Canvas(wrap, bg=PANEL_BG, highlightthickness=0, yscrollcommand=on_view,
+                       cursor="hand2")
         tc.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         vsb.config(command=tc.yview)
-        inner = tk.Frame(tc, bg=PANEL_BG)
-        tc.create_window((0, 0), window=inner, anchor=tk.NW)
-        inner.bind("<Configure>", lambda e: tc.config(scrollregion=tc.bbox("all")))
         tc.bind("<MouseWheel>",
                 lambda e: tc.yview_scroll(-1 if e.delta > 0 else 1, "units"))
 
-        cols_n = max(1, (SIDEBAR_W - 32) // (THUMB + 8))
+        grid = {"frame": wrap, "canvas": tc,
+                "paths": [], "strips": {}, "names": [], "n": 0, "sel": None,
+                "rect":  tc.create_rectangle(0, 0, 0, 0, outline=BTN_ACTIVE_BG,
+                                             width=3, state=tk.HIDDEN)}
+        pw, ph = THUMB_CELL
+
+        def click(e):
+            x, y = tc.canvasx(e.x), tc.canvasy(e.y)
+            i = int(y // ph) * THUMB_COLS + int(x // pw)
+            if 0 <= x < THUMB_COLS * pw and 0 <= i < grid["n"]:
+                on_click(i)
+        # Only the sheet and its captions take clicks, not the empty canvas.
+        tc.tag_bind("cell", "<Button-1>", click)
+        return grid
+
+    def _fill_thumb_grid(self, grid, items):
+        """Show *items* on an existing grid, reusing its name items; the
+        ones left over are hidden rather than deleted."""
+        tc, names = grid["canvas"], grid["names"]
+        pw, ph = THUMB_CELL
+        self._update_selection_highlight(grid, grid["sel"], None)
+        grid["paths"] = [item.path for item in items]
+        tc.delete("strip")
+        grid["strips"] = {}
+
         for i, item in enumerate(items):
-            ci, ri = i % cols_n, i // cols_n
-            sel    = (i == selected_idx)
-            cell   = tk.Frame(inner, bg=BTN_ACTIVE_BG if sel else BTN_BG,
-                              bd=2, relief=tk.FLAT)
-            cell.grid(row=ri, column=ci, padx=3, pady=3)
-            try:
-                photo = self.library.cache.get_thumb(str(item.path), THUMB)
-                self._thumb_refs.append(photo)
-                il = tk.Label(cell, image=photo,
-                              bg=BTN_ACTIVE_BG if sel else BTN_BG, cursor="hand2")
-                il.pack()
-            except Exception:
-                il = tk.Label(cell, text="?", bg=BTN_BG, fg=TEXT,
-                              width=THUMB // 10, height=3, cursor="hand2")
-                il.pack()
-            nl = tk.Label(cell, text=item.name[:13],
-                          bg=BTN_ACTIVE_BG if sel else BTN_BG,
-                          fg=BTN_ACTIVE_FG if sel else BTN_FG,
-                          font=("Helvetica", 9))
-            nl.pack()
-            for w in (cell, il, nl):
-                w.bind("<Button-1>", lambda e, idx=i: on_click(idx))
+            x = (i % THUMB_COLS) * pw + pw // 2
+            y = (i // THUMB_COLS) * ph + THUMB + 16
+            if i < len(names):
+                tc.coords(names[i], x, y)
+                tc.itemconfigure(names[i], text=item.display_name, state=tk.NORMAL)
+            else:
+                names.append(tc.create_text(x, y, text=item.display_name, fill=BTN_FG,
+                                            font=("Helvetica", 9), tags="cell"))
+        for nid in names[len(items):grid["n"]]:
+            tc.itemconfigure(nid, state=tk.HIDDEN)
+        grid["n"] = len(items)
+        tc.tag_raise(grid["rect"])
+        tc.config(scrollregion=(0, 0, THUMB_COLS * pw, -(-len(items) // THUMB_COLS) * ph))
+        tc.yview_moveto(0)
+        self._show_strips(grid)
+
+    def _show_strips(self, grid):
+        """Put up the sheet strips covering the visible rows, if not yet there."""
+        tc, strips = grid["canvas"], grid["strips"]
+        rows   = -(-grid["n"] // THUMB_COLS)
+        band_h = SHEET_STRIP_ROWS * THUMB_CELL[1]
+        top    = max(0, tc.canvasy(0))
+        for band in range(int(top // band_h), int((top + tc.winfo_height()) // band_h) + 1):
+            first = band * SHEET_STRIP_ROWS
+            if first >= rows or band in strips:
+                continue
+            strips[band] = self.library.cache.get_sheet_strip(
+                grid["paths"], THUMB, THUMB_COLS, THUMB_CELL, first, SHEET_STRIP_ROWS)
+            # Under the captions and the selection rectangle.
+            tc.tag_lower(tc.create_image(0, first * THUMB_CELL[1], image=strips[band],
+                                         anchor=tk.NW, tags=("strip", "cell")))
+
+    @staticmethod
+    def _update_selection_highlight(grid, old_idx, new_idx):
+        """Move the selection from *old_idx* to *new_idx*; only those two
+        cells are touched."""
+        tc, names = grid["canvas"], grid["names"]
+        if old_idx is not None:
+            tc.itemconfigure(names[old_idx], fill=BTN_FG)
+        if new_idx is None or new_idx >= grid["n"]:
+            tc.itemconfigure(grid["rect"], state=tk.HIDDEN)
+            grid["sel"] = None
+            return
+        pw, ph = THUMB_CELL
+        x, y   = (new_idx % THUMB_COLS) * pw, (new_idx // THUMB_COLS) * ph
+        tc.coords(grid["rect"], x + 3, y + 3, x + pw - 3, y + ph - 3)
+        tc.itemconfigure(grid["rect"], state=tk.NORMAL)
+        tc.itemconfigure(names[new_idx], fill=BTN_ACTIVE_FG)
+        grid["sel"] = new_idx
+
+    def _sync_category(self, panel, cat, items, on_click):
+        """Repaint the tabs and refill the grid when the category shown, or
+        the list behind it, has changed."""
+        key = (cat, id(items))
+        if panel["grid_key"] == key:
+            return
+        self._paint_tabs(panel["tabs"], cat)
+        panel["grid_key"] = key
+        grid, empty = panel.get("grid"), panel.get("empty")
+        if not items:
+            # No grid to fill: a label, made the first time it is needed.
+            if grid is not None:
+                self._show(grid["frame"], False)
+            if empty is None:
+                panel["empty"] = self._lbl(panel["grid_host"], "No images in this category.")
+            else:
+                self._show(empty, True, anchor=tk.W, padx=10, pady=(6, 2))
+            return
+        if empty is not None:
+            self._show(empty, False)
+        if grid is None:
+            grid = panel["grid"] = self._thumb_grid(panel["grid_host"], on_click)
+        else:
+            self._show(grid["frame"], True, fill=tk.BOTH, expand=True, padx=8, pady=4)
+        self._fill_thumb_grid(grid, items)
 
     # ── Tile sidebar ──────────────────────────────────────────────────────────
 
-    def _build_tile_sidebar(self):
-        p = self.sidebar
+    def _build_tile_sidebar(self, panel):
+        p = panel["frame"]
         self._lbl(p, "TILE CATEGORY", bold=True)
-        cats = list(self.library.categories.keys())
-        self._category_tabs(p, cats, self.sel_category, self._sel_tile_cat)
+        cats = self._cats_cached
+        panel["tabs"] = self._category_tabs(p, cats, self.sel_category, self._sel_tile_cat)
 
         self._divider(p)
-        self._lbl(p, f"ROTATION  ({self.placement_rot + 1}/6 × 60°)", bold=True)
+        panel["rot_lbl"] = self._lbl(p, "", bold=True)
         row = tk.Frame(p, bg=PANEL_BG)
         row.pack(fill=tk.X, padx=8)
         self._btn(row, "◀  Rotate Left",  lambda: self._rotate_tile(-1),
@@ -777,14 +1756,29 @@ class App:
 
         self._divider(p)
         self._lbl(p, "SELECT TILE — click thumbnail, then click map to place", bold=True)
-        tiles = self.library.categories.get(self.sel_category, [])
-        self._thumb_grid(p, tiles, self.sel_tile_idx, self._sel_tile)
-
-        if self.selected_hex and self.selected_hex in self.hex_map.tiles:
-            self._divider(p)
-            self._btn(p, "✖  Remove Tile at Selected Hex",
-                      self._delete_action, style="danger",
-                      fill=tk.X, padx=8, pady=4)
+        panel["grid_host"] = tk.Frame(p, bg=PANEL_BG)
+        panel["grid_host"].pack(fill=tk.BOTH, expand=True)
+        panel["grid_key"] = None
+
+        # Shown only while the selected hex holds a tile.
+        panel["remove"] = tk.Frame(p, bg=PANEL_BG)
+        self._divider(panel["remove"])
+        self._btn(panel["remove"], "✖  Remove Tile at Selected Hex",
+                  self._delete_action, style="danger",
+                  fill=tk.X, padx=8, pady=4)
+
+    def _refresh_tile_category(self, panel):
+        # () rather than [] for a missing category: one object, one key.
+        tiles = self.library.categories.get(self.sel_category, ())
+        self._sync_category(panel, self.sel_category, tiles, self._sel_tile)
+
+    def _refresh_tile_selection(self, panel):
+        panel["rot_lbl"].config(text=f"ROTATION  ({self.placement_rot + 1}/6 × 60°)")
+        self._sync_highlight(panel, self.sel_tile_idx)
+        self._show(panel["remove"],
+                   self.selected_hex is not None and
+                   hex_key(*self.selected_hex) in self.hex_map.tiles,
+                   fill=tk.X)
 
     def _sel_tile_cat(self, cat):
         self.sel_category = cat
@@ -797,43 +1791,62 @@ class App:
         if idx < len(tiles):
             self.status_var.set(
                 f"Selected '{tiles[idx].name}'  •  Click a hex to place  •  R / ← → to rotate")
-        self._rebuild_sidebar()
+        self._refresh_selection_only()
 
     # ── Overlay sidebar ───────────────────────────────────────────────────────
 
-    def _build_overlay_sidebar(self):
-        p = self.sidebar
+    def _build_overlay_sidebar(self, panel):
+        p = panel["frame"]
         self._lbl(p, "OVERLAY CATEGORY", bold=True)
-        ocats = list(self.library.overlay_categories.keys())
+        ocats = self._ocats_cached
         if not ocats:
             self._lbl(p, "No overlays found. Add PNGs to a folder with 'Overlays' in its name.")
             return
-        self._category_tabs(p, ocats, self.sel_ov_category, self._sel_ov_cat)
+        panel["tabs"] = self._category_tabs(p, ocats, self.sel_ov_category, self._sel_ov_cat)
 
         self._divider(p)
         self._lbl(p, "SELECT OVERLAY — click thumbnail, then click map to place", bold=True)
-        ovs = self.library.overlay_categories.get(self.sel_ov_category, [])
-        self._thumb_grid(p, ovs, self.sel_overlay_idx, self._sel_overlay)
-
-        if self.selected_ov_idx is not None and self.selected_ov_idx < len(self.hex_map.overlays):
+        panel["grid_host"] = tk.Frame(p, bg=PANEL_BG)
+        panel["grid_host"].pack(fill=tk.BOTH, expand=True)
+        panel["grid_key"] = None
+
+        # Shown only while a placed overlay is selected.
+        sec = panel["selected"] = tk.Frame(p, bg=PANEL_BG)
+        self._divider(sec)
+        panel["ov_lbl"] = self._lbl(sec, "", bold=True)
+
+        row1 = tk.Frame(sec, bg=PANEL_BG)
+        row1.pack(fill=tk.X, padx=8, pady=2)
+        self._btn(row1, "↺ –15°", lambda: self._rotate_overlay(-OVERLAY_ROT_STEP), side=tk.LEFT, padx=2)
+        self._btn(row1, "↻ +15°", lambda: self._rotate_overlay(OVERLAY_ROT_STEP),  side=tk.LEFT, padx=2)
+
+        row2 = tk.Frame(sec, bg=PANEL_BG)
+        row2.pack(fill=tk.X, padx=8, pady=2)
+        self._btn(row2, "–  Smaller", lambda: self._scale_overlay(-0.1), side=tk.LEFT, padx=2)
+        self._btn(row2, "+  Larger",  lambda: self._scale_overlay(0.1),  side=tk.LEFT, padx=2)
+
+        self._btn(sec, "✖  Delete This Overlay",
+                  lambda: self._delete_overlay(self.selected_ov_idx),
+                  style="danger", fill=tk.X, padx=8, pady=4)
+        self._lbl(sec, "Keyboard: [ ]  rotate  •  – +  scale  •  Del  remove")
+
+    def _refresh_overlay_category(self, panel):
+        if "tabs" not in panel:
+            return      # no overlays loaded
+        ovs = self.library.overlay_categories.get(self.sel_ov_category, ())
+        self._sync_category(panel, self.sel_ov_category, ovs, self._sel_overlay)
+
+    def _refresh_overlay_selection(self, panel):
+        if "tabs" not in panel:
+            return
+        self._sync_highlight(panel, self.sel_overlay_idx)
+        has_sel = (self.selected_ov_idx is not None and
+                   self.selected_ov_idx < len(self.hex_map.overlays))
+        if has_sel:
             ov = self.hex_map.overlays[self.selected_ov_idx]
-            self._divider(p)
-            self._lbl(p, f"SELECTED OVERLAY  —  rotation {ov.rotation}°  •  scale {ov.scale:.2f}×", bold=True)
-
-            row1 = tk.Frame(p, bg=PANEL_BG)
-            row1.pack(fill=tk.X, padx=8, pady=2)
-            self._btn(row1, "↺ –15°", lambda: self._rotate_overlay(-15), side=tk.LEFT, padx=2)
-            self._btn(row1, "↻ +15°", lambda: self._rotate_overlay(15),  side=tk.LEFT, padx=2)
-
-            row2 = tk.Frame(p, bg=PANEL_BG)
-            row2.pack(fill=tk.X, padx=8, pady=2)
-            self._btn(row2, "–  Smaller", lambda: self._scale_overlay(-0.1), side=tk.LEFT, padx=2)
-            self._btn(row2, "+  Larger",  lambda: self._scale_overlay(0.1),  side=tk.LEFT, padx=2)
-
-            self._btn(p, "✖  Delete This Overlay",
-                      lambda: self._delete_overlay(self.selected_ov_idx),
-                      style="danger", fill=tk.X, padx=8, pady=4)
-            self._lbl(p, "Keyboard: [ ]  rotate  •  – +  scale  •  Del  remove")
+            panel["ov_lbl"].config(
+                text=f"SELECTED OVERLAY  —  rotation {ov.rotation}°  •  scale {ov.scale:.2f}×")
+        self._show(panel["selected"], has_sel, fill=tk.X)
 
     def _sel_ov_cat(self, cat):
         self.sel_ov_category = cat
@@ -846,12 +1859,12 @@ class App:
         if idx < len(ovs):
             self.status_var.set(
                 f"Selected '{ovs[idx].name}'  •  Click a hex to place it")
-        self._rebuild_sidebar()
+        self._refresh_selection_only()
 
     # ── Controls sidebar ──────────────────────────────────────────────────────
 
-    def _build_view_sidebar(self):
-        p = self.sidebar
+    def _build_view_sidebar(self, panel):
+        p = panel["frame"]
         self._lbl(p, "CONTROLS & HELP", fg=ACCENT, size=13, bold=True)
 
         # Folder explanation box
@@ -872,20 +1885,17 @@ class App:
         self._divider(p)
         self._lbl(p, "MAP INFO", fg=ACCENT, size=11, bold=True)
 
-        n_ov = sum(len(v) for v in self.library.overlay_categories.values())
-        for label, val in [
-            ("Tiles placed:",     str(len(self.hex_map.tiles))),
-            ("Overlays placed:",  str(len(self.hex_map.overlays))),
-            ("Tile sets loaded:", str(len(self.library.categories))),
-            ("Overlay sets:",     str(len(self.library.overlay_categories))),
-            ("Overlay images:",   str(n_ov)),
-        ]:
+        panel["stats"] = []
+        for label in ("Tiles placed:", "Overlays placed:", "Tile sets loaded:",
+                      "Overlay sets:", "Overlay images:"):
             row = tk.Frame(p, bg=PANEL_BG)
             row.pack(fill=tk.X, padx=10, pady=1)
             tk.Label(row, text=label, bg=PANEL_BG, fg=TEXT_DIM,
                      font=("Helvetica", 11)).pack(side=tk.LEFT)
-            tk.Label(row, text=val, bg=PANEL_BG, fg=TEXT,
-                     font=("Helvetica", 11, "bold")).pack(side=tk.LEFT, padx=4)
+            val = tk.Label(row, bg=PANEL_BG, fg=TEXT,
+                           font=("Helvetica", 11, "bold"))
+            val.pack(side=tk.LEFT, padx=4)
+            panel["stats"].append(val)
 
         self._divider(p)
         self._lbl(p, "KEYBOARD SHORTCUTS", fg=ACCENT, size=11, bold=True)
@@ -904,29 +1914,48 @@ class App:
             ("Ctrl+O",        "Choose image folder"),
             ("Ctrl+E",        "Export image"),
         ]
+        # Read-only; the tab stop lines up the descriptions.
+        text = tk.Text(p, height=len(shortcuts), width=1, bg=PANEL_BG, fg=TEXT,
+                       font=("Helvetica", 10), bd=0, highlightthickness=0,
+                       wrap=tk.NONE, tabs=(120,), spacing1=1, spacing3=1,
+                       cursor="arrow", takefocus=0)
+        text.tag_configure("key", foreground=ACCENT, font=("Helvetica", 10, "bold"))
         for key, desc in shortcuts:
-            row = tk.Frame(p, bg=PANEL_BG)
-            row.pack(fill=tk.X, padx=10, pady=1)
-            tk.Label(row, text=key, bg=PANEL_BG, fg=ACCENT,
-                     font=("Helvetica", 10, "bold"), width=14,
-                     anchor=tk.W).pack(side=tk.LEFT)
-            tk.Label(row, text=desc, bg=PANEL_BG, fg=TEXT,
-                     font=("Helvetica", 10)).pack(side=tk.LEFT)
+            text.insert(tk.END, key, "key")
+            text.insert(tk.END, f"\t{desc}\n")
+        text.delete("end-1c")       # no empty line after the last row
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.X, padx=10)
+
+        # Shown only while a hex is selected.
+        sec = panel["hex"] = tk.Frame(p, bg=PANEL_BG)
+        self._divider(sec)
+        panel["hex_title"] = self._lbl(sec, "", fg=ACCENT, size=11, bold=True)
+        panel["hex_info"]  = tk.Label(sec, bg=PANEL_BG, font=("Helvetica", 10),
+                                      justify=tk.LEFT)
+        panel["hex_info"].pack(anchor=tk.W, padx=10)
+
+    def _refresh_view_sidebar(self, panel):
+        for val, n in zip(panel["stats"], (len(self.hex_map.tiles),
+                                            len(self.hex_map.overlays),
+                                            len(self._cats_cached),
+                                            len(self._ocats_cached),
+                                            self.library.overlay_image_count)):
+            val.config(text=str(n))
 
         if self.selected_hex:
-            self._divider(p)
             col, row = self.selected_hex
-            self._lbl(p, f"Selected hex: ({col}, {row})", fg=ACCENT, size=11, bold=True)
-            if self.selected_hex in self.hex_map.tiles:
-                t = self.hex_map.tiles[self.selected_hex]
-                for line in [Path(t.path).stem,
-                              f"Category: {t.category}",
-                              f"Rotation: {t.rotation} × 60°"]:
-                    tk.Label(p, text=f"  {line}", bg=PANEL_BG, fg=TEXT,
-                             font=("Helvetica", 10)).pack(anchor=tk.W, padx=10)
+            panel["hex_title"].config(text=f"Selected hex: ({col}, {row})")
+            t = self.hex_map.tiles.get(hex_key(col, row))
+            if t is not None:
+                lines = [t.stem,
+                         f"Category: {t.category}",
+                         f"Rotation: {t.rotation} × 60°"]
+                panel["hex_info"].config(
+                    text="\n".join(f"  {line}" for line in lines), fg=TEXT)
             else:
-                tk.Label(p, text="  (empty hex)", bg=PANEL_BG, fg=TEXT_DIM,
-                         font=("Helvetica", 10)).pack(anchor=tk.W, padx=10)
+                panel["hex_info"].config(text="  (empty hex)", fg=TEXT_DIM)
+        self._show(panel["hex"], bool(self.selected_hex), fill=tk.X)
 
 
     # ── Export image ──────────────────────────────────────────────────────────
@@ -996,8 +2025,8 @@ class App:
 
         # Work out bounding box in pixel space at RENDER_HEX size
         all_centres = []
-        for (col, row) in self.hex_map.tiles:
-            all_centres.append(hex_to_pixel(col, row, RENDER_HEX))
+        for t in self.hex_map.tiles.values():
+            all_centres.append(hex_to_pixel(t.col, t.row, RENDER_HEX))
         for ov in self.hex_map.overlays:
             hx, hy = hex_to_pixel(ov.col, ov.row, RENDER_HEX)
             all_centres.append((hx + ov.offset_x * RENDER_HEX / max(self.hex_size, 1),
@@ -1023,8 +2052,8 @@ class App:
             return int(hx - min_x), int(hy - min_y)
 
         # Draw tiles
-        for (col, row), tile in self.hex_map.tiles.items():
-            hx, hy = hex_to_pixel(col, row, RENDER_HEX)
+        for tile in self.hex_map.tiles.values():
+            hx, hy = hex_to_pixel(tile.col, tile.row, RENDER_HEX)
             ox, oy = offset(hx, hy)
             size   = int(RENDER_HEX * 2)
             try:
@@ -1084,12 +2113,17 @@ class App:
 
 if __name__ == "__main__":
     try:
-        from PIL import Image, ImageTk
+        from PIL import Image, ImageDraw, ImageTk
     except ImportError:
-        import subprocess, sys
+        import subprocess
         print("Installing Pillow...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pillow"])
-        from PIL import Image, ImageTk
+        from PIL import Image, ImageDraw, ImageTk
+
+    import PIL
+    if ".post" not in PIL.__version__:
+        print("Tip: Pillow-SIMD (pip3 install pillow-simd) resizes tiles several "
+              "times faster than stock Pillow.")
 
     root = tk.Tk()
     App(root)